@@ -14,9 +14,9 @@ from src.session import Session
 from src.utils.responses import AuthResponse
 
 
-def register(request: RegisterRequest, customer_dao: CustomerDAO) -> AuthResponse:
+async def register(request: RegisterRequest, customer_dao: CustomerDAO) -> AuthResponse:
     try:
-        result = customer_dao.client.auth.sign_up(request.auth_model_dump())
+        result = await customer_dao.client.auth.sign_up(request.auth_model_dump())
         customer = Customer.validate_supabase_user(result.user)
         return AuthResponse(customer=customer)
     except AuthApiError as e:
@@ -31,15 +31,17 @@ def register(request: RegisterRequest, customer_dao: CustomerDAO) -> AuthRespons
         )
 
 
-def login(request: LoginRequest, customer_dao: CustomerDAO) -> AuthResponse:
+async def login(request: LoginRequest, customer_dao: CustomerDAO) -> AuthResponse:
     try:
-        if not customer_dao.get_by_query(email=request.email):
+        if not await customer_dao.get_by_query(email=request.email):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Customer not found",
             )
-        result: GoTrueAuthResponse = customer_dao.client.auth.sign_in_with_password(
-            request.auth_model_dump()
+        result: GoTrueAuthResponse = (
+            await customer_dao.client.auth.sign_in_with_password(
+                request.auth_model_dump()
+            )
         )
         customer = Customer.validate_supabase_user(result.user)
         session = Session.validate_supabase_session(result.session)
@@ -3,31 +3,122 @@ Defines dependencies for authentication, including JWT decoding and token extrac
 mechanisms for secured endpoints.
 """
 
+import time
+from functools import lru_cache
+from typing import Any, Optional
+
+import orjson
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from fastapi.security.api_key import APIKeyHeader
-from jwt import InvalidTokenError, PyJWTError, decode
+from jwt import (
+    DecodeError,
+    InvalidAlgorithmError,
+    InvalidAudienceError,
+    InvalidTokenError,
+    MissingRequiredClaimError,
+    PyJWK,
+    PyJWT,
+    PyJWTError,
+)
+from jwt.utils import base64url_decode, base64url_encode
 
 from src.config import Config
 
 
+class _OrjsonPyJWT(PyJWT):
+    """PyJWT decoder that parses the token payload with orjson instead of json."""
+
+    def _decode_payload(self, decoded: dict[str, Any]) -> Any:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise DecodeError(f"Invalid payload string: {e}") from e
+        if not isinstance(payload, dict):
+            raise DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+_jwt = _OrjsonPyJWT()
+
+
+def _make_jwt_key(secret: Optional[str], algorithm: str) -> Optional[PyJWK]:
+    """
+    Wraps an HMAC secret in a PyJWK, which PyJWT uses as-is instead of encoding
+    and re-checking a str key on every decode.
+    """
+    if secret is None:
+        return None
+    jwk = {"kty": "oct", "k": base64url_encode(secret.encode("utf-8")).decode()}
+    return PyJWK(jwk, algorithm=algorithm)
+
+
+# Read once at import, decode_jwt runs on every authenticated request
+_JWT_KEY = _make_jwt_key(Config.JWT.SECRET, Config.JWT.ALGORITHM)
+_JWT_ALGORITHM = Config.JWT.ALGORITHM
+_JWT_ALGORITHMS = [Config.JWT.ALGORITHM]
+_JWT_AUDIENCE = Config.JWT.AUDIENCE
+
+_BEARER = HTTPBearer(scheme_name="Bearer")
+_REFRESH = APIKeyHeader(name="refresh-token")
+
+
+def _screen_jwt(token: str, algorithm: str, audience: str) -> None:
+    """
+    Rejects tokens whose header or audience can never match, without verifying
+    the signature. Nothing read here is trusted; it only spares bogus tokens the
+    HMAC computation.
+    """
+    try:
+        header_segment, payload_segment, _ = token.split(".", 2)
+        header = orjson.loads(base64url_decode(header_segment))
+        payload = orjson.loads(base64url_decode(payload_segment))
+    except ValueError as e:
+        raise DecodeError(f"Invalid token structure: {e}") from e
+    if not isinstance(header, dict) or not isinstance(payload, dict):
+        raise DecodeError("Invalid token structure: must be json objects")
+    if header.get("alg") != algorithm:
+        raise InvalidAlgorithmError("The specified alg value is not allowed")
+    if "aud" not in payload:
+        raise MissingRequiredClaimError("aud")
+    aud = payload["aud"]
+    if audience != aud and (not isinstance(aud, list) or audience not in aud):
+        raise InvalidAudienceError("Audience doesn't match")
+
+
+@lru_cache(maxsize=512)
+def _cached_decode_jwt(token: str) -> dict[str, Any]:
+    """
+    Verifies and decodes a token once.
+
+    Only successful decodes are cached; failures raise and are retried on the next
+    call. Time-dependent claims are re-checked by ``decode_jwt`` on every call.
+    """
+    _screen_jwt(token, _JWT_ALGORITHM, _JWT_AUDIENCE)
+    decoded_data: dict[str, Any] = _jwt.decode(
+        token,
+        key=_JWT_KEY,
+        algorithms=_JWT_ALGORITHMS,
+        audience=_JWT_AUDIENCE,
+    )
+    return decoded_data
+
+
 def decode_jwt(token: str) -> dict[str, str]:
-    if Config.JWT.SECRET is None:
+    if _JWT_KEY is None:
         raise ValueError("JWT_SECRET must be set in the environment")
     try:
-        decoded_data: dict[str, str] = decode(
-            token,
-            key=Config.JWT.SECRET,
-            algorithms=[Config.JWT.ALGORITHM],
-            audience=Config.JWT.AUDIENCE,
-        )
-        return decoded_data
+        decoded_data = _cached_decode_jwt(token)
     except PyJWTError as e:
         raise InvalidTokenError(str(e))
+    exp = decoded_data.get("exp")
+    if exp is not None and exp <= time.time():
+        raise InvalidTokenError("Signature has expired")
+    return dict(decoded_data)
 
 
 async def get_access_token(
-    bearer: HTTPAuthorizationCredentials = Depends(HTTPBearer(scheme_name="Bearer")),
+    bearer: HTTPAuthorizationCredentials = Depends(_BEARER),
 ) -> str:
     try:
         decode_jwt(bearer.credentials)
@@ -39,6 +130,6 @@ async def get_access_token(
 
 
 async def get_refresh_token(
-    token: str = Depends(APIKeyHeader(name="refresh-token")),
+    token: str = Depends(_REFRESH),
 ) -> str:
     return token
@@ -9,8 +9,8 @@ from src.session import Session
 from src.utils.responses import AuthResponse
 
 
-def refresh_token(customer_dao: CustomerDAO) -> AuthResponse:
-    response = customer_dao.client.auth.refresh_session()
+async def refresh_token(customer_dao: CustomerDAO) -> AuthResponse:
+    response = await customer_dao.client.auth.refresh_session()
     customer = Customer.validate_supabase_user(response.user)
     session = Session.validate_supabase_session(response.session)
     return AuthResponse(customer=customer, session=session)
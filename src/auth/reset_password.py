@@ -9,9 +9,11 @@ from src.db.models import Customer
 from src.utils.responses import AuthResponse
 
 
-def reset_password(
+async def reset_password(
     request: ResetPasswordRequest, customer_dao: CustomerDAO
 ) -> AuthResponse:
-    response = customer_dao.client.auth.update_user({"password": request.password})
+    response = await customer_dao.client.auth.update_user(
+        {"password": request.password}
+    )
     customer = Customer.validate_supabase_user(response.user)
     return AuthResponse(customer=customer)
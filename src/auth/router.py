@@ -21,7 +21,10 @@ from src.auth.schemas import (
 from src.auth.verify_otp import verify_otp
 from src.db.dao import CustomerDAO
 from src.db.dao.customer_dao import CustomerDAO
-from src.db.dependencies import get_customer_dao, get_customer_dao_unauthenticated
+from src.db.dependencies import (
+    get_customer_dao_unauthenticated,
+    get_customer_dao_uncached,
+)
 from src.utils.responses import APIResponse
 from src.utils.responses.API_response import APIResponse
 
@@ -38,7 +41,7 @@ async def register_route(
     request: RegisterRequest,
     Customer_dao: CustomerDAO = Depends(get_customer_dao_unauthenticated),
 ) -> APIResponse:
-    if Customer_dao.get_by_query(email=request.email):
+    if await Customer_dao.get_by_query(email=request.email):
         return APIResponse(
             message="Email already in use",
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -46,7 +49,7 @@ async def register_route(
     return APIResponse(
         message="Registration successful",
         status_code=status.HTTP_200_OK,
-        data=register(request, Customer_dao).model_dump(),
+        data=(await register(request, Customer_dao)).model_dump(),
     )
 
 
@@ -63,7 +66,7 @@ async def login_route(
     return APIResponse(
         message="Login successful",
         status_code=status.HTTP_200_OK,
-        data=login(request, Customer_dao).model_dump(),
+        data=(await login(request, Customer_dao)).model_dump(),
     )
 
 
@@ -75,12 +78,12 @@ async def login_route(
 )
 async def reset_password_route(
     request: ResetPasswordRequest,
-    Customer_dao: CustomerDAO = Depends(get_customer_dao),
+    Customer_dao: CustomerDAO = Depends(get_customer_dao_uncached),
 ) -> APIResponse:
     return APIResponse(
         message="Password change successful",
         status_code=status.HTTP_200_OK,
-        data=reset_password(request, Customer_dao).model_dump(),
+        data=(await reset_password(request, Customer_dao)).model_dump(),
     )
 
 
@@ -97,7 +100,7 @@ async def forgot_password_route(
     return APIResponse(
         message="Forget password email sent successfully",
         status_code=status.HTTP_200_OK,
-        data=forget_password(request, Customer_dao).model_dump(),
+        data=(await forget_password(request, Customer_dao)).model_dump(),
     )
 
 
@@ -108,12 +111,12 @@ async def forgot_password_route(
     description="Refresh Customer token",
 )
 async def refresh_token_route(
-    Customer_dao: CustomerDAO = Depends(get_customer_dao),
+    Customer_dao: CustomerDAO = Depends(get_customer_dao_uncached),
 ) -> APIResponse:
     return APIResponse(
         message="Token refresh successful",
         status_code=status.HTTP_200_OK,
-        data=refresh_token(Customer_dao).model_dump(),
+        data=(await refresh_token(Customer_dao)).model_dump(),
     )
 
 
@@ -130,7 +133,7 @@ async def request_otp_route(
     return APIResponse(
         message="OTP request successful",
         status_code=status.HTTP_200_OK,
-        data=request_otp(request, Customer_dao).model_dump(),
+        data=(await request_otp(request, Customer_dao)).model_dump(),
     )
 
 
@@ -147,5 +150,5 @@ async def verify_otp_route(
     return APIResponse(
         message="OTP verification successful",
         status_code=status.HTTP_200_OK,
-        data=verify_otp(request, Customer_dao).model_dump(),
+        data=(await verify_otp(request, Customer_dao)).model_dump(),
     )
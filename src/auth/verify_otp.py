@@ -10,8 +10,10 @@ from src.session import Session
 from src.utils.responses.auth_response import AuthResponse
 
 
-def verify_otp(request: VerifyOTPRequest, customer_dao: CustomerDAO) -> AuthResponse:
-    response = customer_dao.client.auth.verify_otp(
+async def verify_otp(
+    request: VerifyOTPRequest, customer_dao: CustomerDAO
+) -> AuthResponse:
+    response = await customer_dao.client.auth.verify_otp(
         {"email": request.email, "token": request.otp, "type": "recovery"}
     )
     customer = Customer.validate_supabase_user(response.user)
@@ -14,7 +14,7 @@ from typing import (
     get_type_hints,
 )
 
-from fastapi import Depends, Query, status
+from fastapi import Depends, Query, Request, Response, status
 from fastapi.routing import APIRouter
 from pydantic import BaseModel as PydanticBaseModel
 from pydantic import create_model
@@ -22,7 +22,7 @@ from pydantic import create_model
 from src.controllers.schemas._base_schemas import BaseResponse
 from src.db.dao import BaseDAO
 from src.db.models import BaseModel
-from src.utils.responses import APIResponse
+from src.utils.responses import APIResponse, etag_matches, make_etag
 from src.utils.types import UuidStr
 
 BaseModelType = TypeVar("BaseModelType", bound=BaseModel)
@@ -78,7 +78,7 @@ class BaseRouter(Generic[BaseModelType]):
             APIResponse: The response containing the retrieved items or an error message.
         """
         try:
-            items = dao.get_by_query(**query.model_dump())
+            items = await dao.get_by_query(**query.model_dump())
             if items:
                 return APIResponse(
                     status_code=status.HTTP_200_OK,
@@ -111,7 +111,7 @@ class BaseRouter(Generic[BaseModelType]):
             APIResponse: The response indicating success or failure.
         """
         try:
-            item = dao.create(request)
+            item = await dao.create(request)
             if item:
                 return APIResponse(
                     status_code=status.HTTP_201_CREATED,
@@ -144,7 +144,7 @@ class BaseRouter(Generic[BaseModelType]):
             APIResponse: The response indicating success or failure.
         """
         try:
-            items = dao.create_many(request)
+            items = await dao.create_many(request)
             if items:
                 return APIResponse(
                     status_code=status.HTTP_201_CREATED,
@@ -161,25 +161,43 @@ class BaseRouter(Generic[BaseModelType]):
                 message=str(e),
             )
 
-    async def get_by_id(self, id: UuidStr, dao: BaseDAO[BaseModelType]) -> APIResponse:
+    async def get_by_id(
+        self,
+        id: UuidStr,
+        dao: BaseDAO[BaseModelType],
+        if_none_match: Optional[str] = None,
+    ) -> Response:
         """
         Retrieves an item by its ID.
 
+        The response carries an ETag derived from the item's content; if it matches
+        the client's If-None-Match header, a bodyless 304 is returned without
+        building the response body.
+
         Args:
             id (UuidStr): The UUID of the item.
             dao (BaseDAO[BaseModelType]): The data access object.
+            if_none_match (Optional[str]): The request's If-None-Match header.
 
         Returns:
-            APIResponse: The response containing the retrieved item or an error message.
+            Response: The response containing the retrieved item or an error message.
         """
         try:
-            item = dao.get_by_id(id)
+            item = await dao.get_by_id(id)
             if item:
-                return APIResponse(
+                etag = make_etag(item.model_dump_json().encode())
+                if etag_matches(if_none_match, etag):
+                    return Response(
+                        status_code=status.HTTP_304_NOT_MODIFIED,
+                        headers={"ETag": etag},
+                    )
+                response = APIResponse(
                     status_code=status.HTTP_200_OK,
                     message=f"{self.name} found",
                     data=BaseResponse[BaseModelType](items=[item]).model_dump(),
                 )
+                response.headers["ETag"] = etag
+                return response
             return APIResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
                 message=f"{self.name} not found",
@@ -208,7 +226,7 @@ class BaseRouter(Generic[BaseModelType]):
             APIResponse: The response indicating success or failure.
         """
         try:
-            item = dao.update(id, request)
+            item = await dao.update(id, request)
             if item:
                 return APIResponse(
                     status_code=status.HTTP_200_OK,
@@ -237,7 +255,7 @@ class BaseRouter(Generic[BaseModelType]):
             APIResponse: The response indicating success or failure.
         """
         try:
-            item = dao.delete(id)
+            item = await dao.delete(id)
             if item:
                 return APIResponse(
                     status_code=status.HTTP_200_OK,
@@ -286,9 +304,10 @@ class BaseRouter(Generic[BaseModelType]):
         @self.router.get("/{id}")
         async def get_by_id(
             id: UuidStr,
+            request: Request,
             dao: BaseDAO[BaseModelType] = Depends(self.get_dao),
-        ) -> APIResponse:
-            return await self.get_by_id(id, dao)
+        ) -> Response:
+            return await self.get_by_id(id, dao, request.headers.get("if-none-match"))
 
         @self.router.put("/{id}")
         async def update(
@@ -2,15 +2,20 @@
 This module defines the router for handling customer-related operations, including wallet management.
 """
 
-from fastapi import Depends, status
+import uuid
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, status
 from pydantic import PositiveFloat
 
 from src.controllers.routers import BaseRouter
-from src.db.dao import BaseDAO
+from src.controllers.schemas.wallet_request_schema import WalletDeductionBatch
+from src.db.dao import CustomerDAO
 from src.db.dependencies import get_customer_dao
 from src.db.models import Customer
 from src.utils.responses.API_response import APIResponse
 from src.utils.types import UuidStr
+from src.utils.types.UuidStr import UUID_RE
 
 customers_router = BaseRouter[Customer](
     prefix="/customers",
@@ -20,94 +25,140 @@ customers_router = BaseRouter[Customer](
     get_dao=get_customer_dao,
 ).build_router()
 
+CustomerDep = Annotated[CustomerDAO, Depends(get_customer_dao)]
+
+
+def _check_uuid(id: str) -> None:
+    """
+    Rejects a malformed UUID path parameter with a 422.
+
+    Args:
+        id (str): The path parameter to check.
+
+    Raises:
+        HTTPException: If the id is not a canonical UUID.
+    """
+    if not UUID_RE.match(id):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"{id} is an invalid UUID",
+        )
+
 
 @customers_router.put("/deduct/{id}")
 async def deduct_money(
-    id: UuidStr,
+    id: str,
     amount: PositiveFloat,
-    customer_dao: BaseDAO[Customer] = Depends(get_customer_dao),
+    dao: CustomerDep,
 ) -> APIResponse:
     """
     Deducts a specified amount of money from the customer's wallet.
 
     Args:
-        id (UuidStr): The UUID of the customer.
+        id (str): The UUID of the customer.
         amount (PositiveFloat): The amount to deduct.
-        customer_dao (BaseDAO[Customer]): The data access object for customers.
+        dao (CustomerDAO): The data access object for customers.
 
     Returns:
         APIResponse: The response indicating success or failure.
     """
-    try:
-        customer = customer_dao.get_by_id(id)
-        if not customer:
+    _check_uuid(id)
+    updated_customer = await dao.deduct_wallet(id, amount)
+    if not updated_customer:
+        # Only the failure path needs a second lookup to tell the cases apart
+        wallet = await dao.get_wallet(id)
+        if wallet is None:
             return APIResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
                 message="Customer not found",
             )
-        curr_wallet = customer.wallet
-        if curr_wallet < amount:
-            return APIResponse(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                message="Not enough money in wallet",
-                data={"wallet": curr_wallet},
-            )
-        new_wallet = curr_wallet - amount
-        updated_customer = customer_dao.update(id, {"wallet": new_wallet})
-
-        assert updated_customer is not None
-
         return APIResponse(
-            status_code=status.HTTP_200_OK,
-            message="Money deducted successfully",
-            data=updated_customer.model_dump(),
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message="Not enough money in wallet",
+            data={"wallet": wallet},
         )
-    except Exception as e:
+
+    return APIResponse(
+        status_code=status.HTTP_200_OK,
+        message="Money deducted successfully",
+        data={"wallet": updated_customer.wallet},
+    )
+
+
+@customers_router.put("/wallet/batch")
+async def deduct_money_batch(
+    request: WalletDeductionBatch,
+    dao: CustomerDep,
+) -> APIResponse:
+    """
+    Deducts money from several customers' wallets in a single database call.
+
+    Amounts for the same customer are summed. Each deduction is applied only if
+    the customer exists and has enough money; the others are reported as failed.
+    The request only fails as a whole when none of the deductions were applied.
+
+    Args:
+        request (WalletDeductionBatch): The customers and amounts to deduct, at
+            least one and at most MAX_BATCH_DEDUCTIONS.
+        dao (CustomerDAO): The data access object for customers.
+
+    Returns:
+        APIResponse: The new wallet balances and the ids that could not be charged.
+    """
+    deductions: dict[UuidStr, float] = {}
+    for deduction in request:
+        id = str(uuid.UUID(deduction.id))
+        deductions[id] = deductions.get(id, 0.0) + deduction.amount
+    wallets = await dao.deduct_wallet_many(deductions)
+    failed = [id for id in deductions if id not in wallets]
+    if failed and not wallets:
         return APIResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            message=str(e),
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message="No deductions could be applied",
+            data={"wallets": wallets, "failed": failed},
         )
+    return APIResponse(
+        status_code=status.HTTP_200_OK,
+        message=(
+            "Some deductions could not be applied"
+            if failed
+            else "Money deducted successfully"
+        ),
+        data={"wallets": wallets, "failed": failed},
+    )
 
 
 @customers_router.put("/add_money/{id}")
 async def add_money_to_wallet(
-    id: UuidStr,
+    id: str,
     money: PositiveFloat,
-    dao: BaseDAO[Customer] = Depends(get_customer_dao),
+    dao: CustomerDep,
 ) -> APIResponse:
     """
     Adds a specified amount of money to the customer's wallet.
 
     Args:
-        id (UuidStr): The UUID of the customer.
+        id (str): The UUID of the customer.
         money (PositiveFloat): The amount of money to add.
-        dao (BaseDAO): The data access object for customers.
+        dao (CustomerDAO): The data access object for customers.
 
     Returns:
         APIResponse: The response indicating success or failure.
     """
-    # Get the customer by ID using the DAO
-    customer = dao.get_by_id(id)
-    if not customer:
+    _check_uuid(id)
+    updated_customer = await dao.add_to_wallet(id, money)
+    if not updated_customer:
         return APIResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             message="Customer not found",
         )
-    prev_money = customer.wallet
-    # Add money to the wallet
-    new_wallet_amount = prev_money + money
-    updated_customer = dao.update(id, {"wallet": new_wallet_amount})
-    if updated_customer:
-        return APIResponse(
-            status_code=status.HTTP_200_OK,
-            message="Money added to wallet",
-            data={"wallet": updated_customer.wallet},
-        )
     return APIResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        message="Failed to update wallet",
+        status_code=status.HTTP_200_OK,
+        message="Money added to wallet",
+        data={"wallet": updated_customer.wallet},
     )
 
+
 # API Calls:
 
 # GET /customers/
@@ -173,6 +224,16 @@ async def add_money_to_wallet(
 #     "amount": 20.00
 # }
 
+# PUT /customers/wallet/batch
+# Description: Deduct money from several customers' wallets at once.
+# Method: PUT
+# URL: http://localhost:8000/customers/wallet/batch
+# Body:
+# [
+#     {"id": "uuid-string", "amount": 20.00},
+#     {"id": "uuid-string", "amount": 5.00}
+# ]
+
 # PUT /customers/add_money/{id}
 # Description: Add a specified amount of money to the customer's wallet.
 # Method: PUT
@@ -103,7 +103,7 @@ async def deduct_goods(
         APIResponse: The response containing the result of the deduction operation.
     """
     try:
-        product = inventory_dao.get_by_id(id)
+        product = await inventory_dao.get_by_id(id)
         if not product:
             return APIResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -117,7 +117,7 @@ async def deduct_goods(
                 data={"stock": curr_stock},
             )
         new_stock = curr_stock - amount
-        updated_inventory = inventory_dao.update(id, {"stock": new_stock})
+        updated_inventory = await inventory_dao.update(id, {"stock": new_stock})
 
         assert updated_inventory is not None
 
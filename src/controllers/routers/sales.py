@@ -57,7 +57,7 @@ async def get_goods(
 ) -> APIResponse:
     """Retrieve all available goods."""
     try:
-        all_goods = dao.get_by_query()
+        all_goods = await dao.get_by_query()
         if not all_goods:
             return APIResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -85,7 +85,7 @@ async def get_good(
 ) -> APIResponse:
     """Retrieve a specific good by name."""
     try:
-        good = dao.get_by_query(product_name=name)
+        good = await dao.get_by_query(product_name=name)
         if not good:
             return APIResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -115,7 +115,7 @@ async def purchase_good(
         product_id = request.product_id
         customer_id = request.customer_id
         quantity = request.quantity
-        good = inventory_dao.get_by_id(id=product_id)
+        good = await inventory_dao.get_by_id(id=product_id)
         if not good:
             return APIResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -129,7 +129,7 @@ async def purchase_good(
 
         # print(good)
         total_price = good.price * quantity
-        customer = customer_dao.get_by_id(customer_id)
+        customer = await customer_dao.get_by_id(customer_id)
         if not customer:
             return APIResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -141,16 +141,16 @@ async def purchase_good(
                 message="Not enough money in wallet",
             )
 
-        updated_customer = customer_dao.update(
+        updated_customer = await customer_dao.update(
             customer_id, {"wallet": customer.wallet - total_price}
         )
 
         assert good.id is not None
-        updated_inventory = inventory_dao.update(
+        updated_inventory = await inventory_dao.update(
             good.id, {"quantity": good.quantity - quantity}
         )
 
-        history = history_dao.create(
+        history = await history_dao.create(
             {
                 "customer_id": customer_id,
                 "product_id": product_id,
@@ -179,7 +179,7 @@ async def get_customer_history(
 ) -> APIResponse:
     """Retrieve the purchase history for a specific customer."""
     try:
-        history = dao.get_by_query(customer_id=id)
+        history = await dao.get_by_query(customer_id=id)
         if not history:
             return APIResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -203,7 +203,7 @@ async def get_product_history(
 ) -> APIResponse:
     """Retrieve the purchase history for a specific product."""
     try:
-        history = dao.get_by_query(product_id=id)
+        history = await dao.get_by_query(product_id=id)
         if not history:
             return APIResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
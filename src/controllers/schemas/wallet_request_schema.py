@@ -0,0 +1,18 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field, PositiveFloat
+
+from src.utils.types import UuidStr
+
+MAX_BATCH_DEDUCTIONS = 100
+
+
+class WalletDeduction(BaseModel):
+    id: UuidStr
+    amount: PositiveFloat
+
+
+WalletDeductionBatch = Annotated[
+    list[WalletDeduction],
+    Field(min_length=1, max_length=MAX_BATCH_DEDUCTIONS),
+]
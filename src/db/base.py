@@ -1,34 +1,97 @@
+from collections import OrderedDict
+from typing import AsyncIterator
+
 from fastapi import Depends
-from supabase import Client, create_client
+from supabase import AsyncClient, AsyncClientOptions, acreate_client
 
 from src.auth.dependencies import get_access_token, get_refresh_token
 from src.config import Config
 
+_AUTHENTICATED_CLIENTS_MAXSIZE = 256
+_authenticated_clients: "OrderedDict[tuple[str, str], AsyncClient]" = OrderedDict()
 
-def get_authenticated_client(
-    access_token: str = Depends(get_access_token),
-    refresh_token: str = Depends(get_refresh_token),
-) -> Client:
+
+async def _create_authenticated_client(
+    access_token: str, refresh_token: str
+) -> AsyncClient:
     """
-    Creates and returns an authenticated Supabase client using access and refresh tokens.
+    Creates a Supabase client bound to the given session.
+
+    Token auto-refresh is disabled so the session only changes when a route
+    asks for it explicitly.
     """
     if Config.SUPABASE.KEY is None or Config.SUPABASE.URL is None:
         raise ValueError("SUPABASE_KEY and SUPABASE_URL must be set in the environment")
-    client = create_client(
+    client = await acreate_client(
         supabase_url=Config.SUPABASE.URL,
         supabase_key=Config.SUPABASE.KEY,
+        options=AsyncClientOptions(auto_refresh_token=False),
+    )
+    await client.auth.set_session(
+        access_token=access_token, refresh_token=refresh_token
     )
-    client.auth.set_session(access_token=access_token, refresh_token=refresh_token)
     return client
 
 
-def get_unauthenticated_client() -> Client:
+async def _close_client(client: AsyncClient) -> None:
+    """
+    Closes the HTTP connection pools held by a Supabase client.
+    """
+    await client.auth.close()
+    if client._postgrest is not None:
+        await client._postgrest.aclose()
+
+
+async def get_authenticated_client(
+    access_token: str = Depends(get_access_token),
+    refresh_token: str = Depends(get_refresh_token),
+) -> AsyncClient:
+    """
+    Returns an authenticated Supabase client using access and refresh tokens.
+
+    Clients are keyed by the (access token, refresh token) pair and reused,
+    least recently used first out, for every request that presents the same
+    tokens so their HTTP connections stay open between requests. Routes that
+    change the session must use get_uncached_authenticated_client instead.
+    """
+    key = (access_token, refresh_token)
+    client = _authenticated_clients.get(key)
+    if client is not None:
+        _authenticated_clients.move_to_end(key)
+        return client
+    client = await _create_authenticated_client(access_token, refresh_token)
+    _authenticated_clients[key] = client
+    if len(_authenticated_clients) > _AUTHENTICATED_CLIENTS_MAXSIZE:
+        _, evicted = _authenticated_clients.popitem(last=False)
+        await _close_client(evicted)
+    return client
+
+
+async def get_uncached_authenticated_client(
+    access_token: str = Depends(get_access_token),
+    refresh_token: str = Depends(get_refresh_token),
+) -> AsyncIterator[AsyncClient]:
+    """
+    Yields a Supabase client for a single request, closing it afterwards.
+
+    Used by routes that refresh or otherwise change the session, so that the
+    cached client for the presented tokens never holds a rotated session and
+    a replayed refresh token is still sent to Supabase Auth to be rejected.
+    """
+    client = await _create_authenticated_client(access_token, refresh_token)
+    try:
+        yield client
+    finally:
+        await _close_client(client)
+
+
+async def get_unauthenticated_client() -> AsyncClient:
     """
     Creates and returns an unauthenticated Supabase client.
     """
     if Config.SUPABASE.KEY is None or Config.SUPABASE.URL is None:
         raise ValueError("SUPABASE_KEY and SUPABASE_URL must be set in the environment")
-    return create_client(
+    return await acreate_client(
         supabase_url=Config.SUPABASE.URL,
         supabase_key=Config.SUPABASE.KEY,
     )
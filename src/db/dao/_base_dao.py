@@ -1,6 +1,6 @@
 from typing import Any, Generic, Optional, TypeVar
 
-from supabase import Client
+from supabase import AsyncClient
 
 from src.db.models import BaseModel
 from src.utils.types import UuidStr
@@ -13,19 +13,19 @@ class BaseDAO(Generic[BaseModelType]):
     Generic Data Access Object providing basic CRUD operations.
 
     Args:
-        client (Client): Supabase client instance.
+        client (AsyncClient): Async Supabase client instance.
         table (str): Name of the table.
         base_model (type[BaseModelType]): Pydantic model for the table.
     """
 
     def __init__(
-        self, client: Client, table: str, base_model: type[BaseModelType]
+        self, client: AsyncClient, table: str, base_model: type[BaseModelType]
     ) -> None:
         self.client = client
         self.table = table
         self.base_model = base_model
 
-    def get_by_query(
+    async def get_by_query(
         self,
         **kwargs: Any,
     ) -> list[BaseModelType]:
@@ -42,12 +42,12 @@ class BaseDAO(Generic[BaseModelType]):
         for key, value in kwargs.items():
             if value is not None:
                 query = query.eq(key, value)
-        data = query.execute()
+        data = await query.execute()
         if not data.data:
             return []
         return [self.base_model.model_validate(item) for item in data.data]
 
-    def create(self, model_data: dict[str, Any]) -> Optional[BaseModelType]:
+    async def create(self, model_data: dict[str, Any]) -> Optional[BaseModelType]:
         """
         Create a new record in the table.
 
@@ -58,12 +58,14 @@ class BaseDAO(Generic[BaseModelType]):
             The created model instance or None if creation failed.
         """
         self.base_model.model_validate(model_data)
-        data = self.client.table(self.table).insert(model_data).execute()
+        data = await self.client.table(self.table).insert(model_data).execute()
         if not data.data:
             return None
         return self.base_model.model_validate(data.data[0])
 
-    def create_many(self, model_data: list[dict[str, Any]]) -> list[BaseModelType]:
+    async def create_many(
+        self, model_data: list[dict[str, Any]]
+    ) -> list[BaseModelType]:
         """
         Create multiple records in the table.
 
@@ -75,12 +77,12 @@ class BaseDAO(Generic[BaseModelType]):
         """
         for _data in model_data:
             self.base_model.model_validate(_data)
-        data = self.client.table(self.table).insert(model_data).execute()
+        data = await self.client.table(self.table).insert(model_data).execute()
         if not data.data:
             return []
         return [self.base_model.model_validate(item) for item in data.data]
 
-    def get_by_id(self, id: UuidStr) -> Optional[BaseModelType]:
+    async def get_by_id(self, id: UuidStr) -> Optional[BaseModelType]:
         """
         Retrieve a record by its unique identifier.
 
@@ -90,12 +92,12 @@ class BaseDAO(Generic[BaseModelType]):
         Returns:
             The model instance if found, else None.
         """
-        data = self.client.table(self.table).select("*").eq("id", id).execute()
+        data = await self.client.table(self.table).select("*").eq("id", id).execute()
         if not data.data:
             return None
         return self.base_model.model_validate(data.data[0])
 
-    def update(
+    async def update(
         self, id: UuidStr, model_data: dict[str, Any]
     ) -> Optional[BaseModelType]:
         """
@@ -109,12 +111,17 @@ class BaseDAO(Generic[BaseModelType]):
             The updated model instance if successful, else None.
         """
         self.base_model.model_validate_partial(model_data)
-        data = self.client.table(self.table).update(model_data).eq("id", id).execute()
+        data = (
+            await self.client.table(self.table)
+            .update(model_data)
+            .eq("id", id)
+            .execute()
+        )
         if not data.data:
             return None
         return self.base_model.model_validate(data.data[0])
 
-    def delete(self, id: UuidStr) -> Optional[BaseModelType]:
+    async def delete(self, id: UuidStr) -> Optional[BaseModelType]:
         """
         Delete a record by its unique identifier.
 
@@ -124,7 +131,7 @@ class BaseDAO(Generic[BaseModelType]):
         Returns:
             The deleted model instance if successful, else None.
         """
-        data = self.client.table(self.table).delete().eq("id", id).execute()
+        data = await self.client.table(self.table).delete().eq("id", id).execute()
         if not data.data:
             return None
         return self.base_model.model_validate(data.data[0])
@@ -2,11 +2,14 @@
 Module for Customer Data Access Object.
 """
 
-from supabase import Client
+from typing import Optional
+
+from supabase import AsyncClient
 
 from src.db.dao import BaseDAO
 from src.db.models import Customer
-from src.db.tables import SupabaseTables
+from src.db.tables import SupabaseFunctions, SupabaseTables
+from src.utils.types import UuidStr
 
 
 class CustomerDAO(BaseDAO[Customer]):
@@ -16,11 +19,94 @@ class CustomerDAO(BaseDAO[Customer]):
     Inherits from BaseDAO to provide CRUD operations for Customers.
     """
 
-    def __init__(self, client: Client) -> None:
+    def __init__(self, client: AsyncClient) -> None:
         """
         Initialize the CustomerDAO with a Supabase client.
 
         Args:
-            client: The Supabase client instance.
+            client: The async Supabase client instance.
         """
         super().__init__(client, SupabaseTables.CUSTOMERS, Customer)
+
+    async def get_wallet(self, id: UuidStr) -> Optional[float]:
+        """
+        Retrieve only the wallet balance of a customer.
+
+        Args:
+            id (UuidStr): The unique identifier of the customer.
+
+        Returns:
+            The wallet balance if the customer exists, else None.
+        """
+        data = (
+            await self.client.table(self.table)
+            .select("wallet")
+            .eq("id", id)
+            .limit(1)
+            .execute()
+        )
+        if not data.data:
+            return None
+        return float(data.data[0]["wallet"])
+
+    async def deduct_wallet(self, id: UuidStr, amount: float) -> Optional[Customer]:
+        """
+        Atomically deduct an amount from a customer's wallet.
+
+        Args:
+            id (UuidStr): The unique identifier of the customer.
+            amount (float): The amount to deduct.
+
+        Returns:
+            The updated customer, or None if the customer does not exist or
+            does not have enough money in their wallet.
+        """
+        data = await self.client.rpc(
+            SupabaseFunctions.DEDUCT_WALLET, {"cust_id": id, "amt": amount}
+        ).execute()
+        if not data.data:
+            return None
+        return self.base_model.model_validate(data.data[0])
+
+    async def deduct_wallet_many(
+        self, deductions: dict[UuidStr, float]
+    ) -> dict[UuidStr, float]:
+        """
+        Atomically deduct amounts from several customers' wallets at once.
+
+        Args:
+            deductions (dict[UuidStr, float]): Amount to deduct per customer id.
+
+        Returns:
+            The new wallet balance of every customer that was charged. Customers
+            that do not exist or do not have enough money are left out.
+        """
+        data = await self.client.rpc(
+            SupabaseFunctions.DEDUCT_WALLET_BATCH,
+            {
+                "deductions": [
+                    {"id": id, "amt": amount} for id, amount in deductions.items()
+                ]
+            },
+        ).execute()
+        if not data.data:
+            return {}
+        return {item["id"]: float(item["wallet"]) for item in data.data}
+
+    async def add_to_wallet(self, id: UuidStr, amount: float) -> Optional[Customer]:
+        """
+        Atomically add an amount to a customer's wallet.
+
+        Args:
+            id (UuidStr): The unique identifier of the customer.
+            amount (float): The amount to add.
+
+        Returns:
+            The updated customer, or None if the customer does not exist.
+        """
+        data = await self.client.rpc(
+            SupabaseFunctions.ADD_WALLET, {"cust_id": id, "amt": amount}
+        ).execute()
+        if not data.data:
+            return None
+        return self.base_model.model_validate(data.data[0])
@@ -1,4 +1,4 @@
-from supabase import Client
+from supabase import AsyncClient
 
 from src.db.dao import BaseDAO
 from src.db.models import Inventory
@@ -10,5 +10,5 @@ class InventoryDAO(BaseDAO[Inventory]):
     Data Access Object for managing Inventory items in the database.
     """
 
-    def __init__(self, client: Client) -> None:
+    def __init__(self, client: AsyncClient) -> None:
         super().__init__(client, SupabaseTables.INVENTORY, Inventory)
@@ -2,7 +2,7 @@
 Module for Review Data Access Object.
 """
 
-from supabase import Client
+from supabase import AsyncClient
 
 from src.db.dao import BaseDAO
 from src.db.models import Reviews
@@ -16,11 +16,11 @@ class ReviewDAO(BaseDAO[Reviews]):
     Inherits from BaseDAO to provide CRUD operations for Reviews.
     """
 
-    def __init__(self, client: Client) -> None:
+    def __init__(self, client: AsyncClient) -> None:
         """
         Initialize the ReviewDAO with a Supabase client.
 
         Args:
-            client: The Supabase client instance.
+            client: The async Supabase client instance.
         """
         super().__init__(client, SupabaseTables.REVIEWS, Reviews)
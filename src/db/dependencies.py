@@ -1,18 +1,26 @@
 from fastapi import Depends
-from supabase import Client
+from supabase import AsyncClient
 
-from src.db.base import get_authenticated_client, get_unauthenticated_client
+from src.db.base import (
+    get_authenticated_client,
+    get_unauthenticated_client,
+    get_uncached_authenticated_client,
+)
 from src.db.dao import CustomerDAO, HistoryDAO, InventoryDAO, ReviewDAO
 
 
-def get_customer_dao(client: Client = Depends(get_authenticated_client)) -> CustomerDAO:
+def get_customer_dao(
+    client: AsyncClient = Depends(get_authenticated_client),
+) -> CustomerDAO:
     """
     Provides an authenticated CustomerDAO instance.
     """
     return CustomerDAO(client)
 
 
-def get_history_dao(client: Client = Depends(get_authenticated_client)) -> HistoryDAO:
+def get_history_dao(
+    client: AsyncClient = Depends(get_authenticated_client),
+) -> HistoryDAO:
     """
     Provides an authenticated HistoryDAO instance.
     """
@@ -20,7 +28,7 @@ def get_history_dao(client: Client = Depends(get_authenticated_client)) -> Histo
 
 
 def get_inventory_dao(
-    client: Client = Depends(get_authenticated_client),
+    client: AsyncClient = Depends(get_authenticated_client),
 ) -> InventoryDAO:
     """
     Provides an authenticated InventoryDAO instance.
@@ -28,7 +36,9 @@ def get_inventory_dao(
     return InventoryDAO(client)
 
 
-def get_review_dao(client: Client = Depends(get_authenticated_client)) -> ReviewDAO:
+def get_review_dao(
+    client: AsyncClient = Depends(get_authenticated_client),
+) -> ReviewDAO:
     """
     Provides an authenticated ReviewDAO instance.
     """
@@ -36,9 +46,18 @@ def get_review_dao(client: Client = Depends(get_authenticated_client)) -> Review
 
 
 def get_customer_dao_unauthenticated(
-    client: Client = Depends(get_unauthenticated_client),
+    client: AsyncClient = Depends(get_unauthenticated_client),
 ) -> CustomerDAO:
     """
     Provides an unauthenticated CustomerDAO instance.
     """
     return CustomerDAO(client)
+
+
+def get_customer_dao_uncached(
+    client: AsyncClient = Depends(get_uncached_authenticated_client),
+) -> CustomerDAO:
+    """
+    Provides an authenticated CustomerDAO instance on a client of its own.
+    """
+    return CustomerDAO(client)
@@ -7,3 +7,13 @@ class SupabaseTables:
     INVENTORY = "Inventory"
     HISTORY = "History"
     REVIEWS = "Reviews"
+
+
+class SupabaseFunctions:
+    """
+    Defines the Postgres functions exposed through Supabase RPC.
+    """
+
+    DEDUCT_WALLET = "deduct_wallet"
+    ADD_WALLET = "add_wallet"
+    DEDUCT_WALLET_BATCH = "deduct_wallet_batch"
@@ -3,12 +3,13 @@ Main entry point for the Ecommerce API.
 Initializes the FastAPI app, middleware, and routes.
 """
 
-import os
-import sys
+import logging
 
-from fastapi import FastAPI, status
+import httpx
+from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
+from postgrest.exceptions import APIError as PostgrestAPIError
 
 from src.auth.router import auth_router
 from src.config import Config
@@ -19,22 +20,24 @@ from src.controllers import (
     sales_router,
     status_router,
 )
+from src.utils.responses import APIResponse, etag_matches, make_etag
 
-# Add the project root to sys.path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title=Config.APP.TITLE,
     description=Config.APP.DESCRIPTION,
     version=Config.APP.VERSION,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
+    allow_headers=["authorization", "content-type", "refresh-token", "if-none-match"],
+    max_age=86400,
 )
 app.include_router(inventory_router)
 app.include_router(review_router)
@@ -44,15 +47,81 @@ app.include_router(auth_router)
 app.include_router(sales_router)
 
 
-@app.get("/", response_class=HTMLResponse)
-async def root() -> HTMLResponse:
+@app.exception_handler(PostgrestAPIError)
+async def postgrest_error_handler(
+    request: Request, exc: PostgrestAPIError
+) -> APIResponse:
     """
-    Serve the welcome HTML page for the Ecommerce API.
+    Turn a database error raised by a route into a 500 APIResponse.
+
+    PostgREST messages describe policies, constraints and columns, so the error
+    is logged and a fixed message is returned.
+
+    Args:
+        request (Request): The request that failed.
+        exc (PostgrestAPIError): The error raised by PostgREST.
+
+    Returns:
+        APIResponse: The error response.
+    """
+    logger.error(
+        "PostgREST error on %s %s", request.method, request.url.path, exc_info=exc
+    )
+    return APIResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        message="Database request failed",
+    )
+
+
+@app.exception_handler(httpx.HTTPError)
+async def http_error_handler(request: Request, exc: httpx.HTTPError) -> APIResponse:
+    """
+    Turn a failed request to Supabase raised by a route into a 500 APIResponse.
+
+    The error text may name internal hosts, so the error is logged and a fixed
+    message is returned.
+
+    Args:
+        request (Request): The request that failed.
+        exc (httpx.HTTPError): The transport or protocol error.
+
+    Returns:
+        APIResponse: The error response.
+    """
+    logger.error(
+        "Supabase request failed on %s %s",
+        request.method,
+        request.url.path,
+        exc_info=exc,
+    )
+    return APIResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        message="Database request failed",
+    )
+
+
+@app.exception_handler(Exception)
+async def unhandled_error_handler(request: Request, exc: Exception) -> APIResponse:
+    """
+    Turn any other unhandled error raised by a route into a generic 500 APIResponse.
+
+    Starlette runs this handler outside the CORS middleware, so typed errors
+    that clients should see are registered above instead.
+
+    Args:
+        request (Request): The request that failed.
+        exc (Exception): The unhandled error.
 
     Returns:
-        HTMLResponse: The HTML content with welcome message and links to documentation.
+        APIResponse: The error response.
     """
-    html_content = """
+    return APIResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        message="Internal Server Error",
+    )
+
+
+_ROOT_HTML = b"""
     <html>
         <head>
             <title>Ecommerce Abboud Fakhreddine 435L</title>
@@ -78,4 +147,26 @@ async def root() -> HTMLResponse:
         </body>
     </html>
     """
-    return HTMLResponse(content=html_content, status_code=status.HTTP_200_OK)
+_ROOT_ETAG = make_etag(_ROOT_HTML)
+_ROOT_HEADERS = {"ETag": _ROOT_ETAG, "Cache-Control": "public, max-age=3600"}
+
+
+@app.get("/", response_class=HTMLResponse)
+async def root(request: Request) -> Response:
+    """
+    Serve the welcome HTML page for the Ecommerce API.
+
+    The page is static, so its body and ETag are built once at import and clients
+    that already hold it get a 304 Not Modified.
+
+    Args:
+        request (Request): The incoming request.
+
+    Returns:
+        Response: The HTML content with welcome message and links to documentation.
+    """
+    if etag_matches(request.headers.get("if-none-match"), _ROOT_ETAG):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_ROOT_HEADERS)
+    return HTMLResponse(
+        content=_ROOT_HTML, status_code=status.HTTP_200_OK, headers=_ROOT_HEADERS
+    )
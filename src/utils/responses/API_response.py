@@ -3,14 +3,14 @@
 from typing import Any, TypeVar
 
 from fastapi import status
-from fastapi.responses import JSONResponse as FastAPIJSONResponse
+from fastapi.responses import ORJSONResponse
 
 from src.db.models import BaseModel
 
 BaseModelType = TypeVar("BaseModelType", bound=BaseModel)
 
 
-class APIResponse(FastAPIJSONResponse):
+class APIResponse(ORJSONResponse):
     """A custom JSON response class for API endpoints."""
 
     media_type = "application/json"
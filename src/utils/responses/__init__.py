@@ -1,4 +1,5 @@
 from .API_response import APIResponse
 from .auth_response import AuthResponse
+from .etag import etag_matches, make_etag
 
-__all__ = ["APIResponse", "AuthResponse"]
+__all__ = ["APIResponse", "AuthResponse", "etag_matches", "make_etag"]
@@ -0,0 +1,43 @@
+"""
+Module providing helpers for ETag-based conditional responses.
+"""
+
+import hashlib
+from typing import Optional
+
+
+def make_etag(body: bytes) -> str:
+    """
+    Computes a strong ETag from a response body.
+
+    Args:
+        body (bytes): The serialized response body.
+
+    Returns:
+        str: The quoted ETag value.
+    """
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Checks whether an If-None-Match header matches an ETag.
+
+    The header may list several tags separated by commas, or be "*". Tags are
+    compared weakly, so a W/ prefix on either side is ignored.
+
+    Args:
+        if_none_match (Optional[str]): The request's If-None-Match header.
+        etag (str): The current ETag of the resource.
+
+    Returns:
+        bool: True if the client's cached copy is still current.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    etag = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
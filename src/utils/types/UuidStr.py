@@ -2,11 +2,17 @@
 This module provides utilities for validating and handling UUID strings.
 """
 
+import re
 import uuid
 from typing import Annotated, Optional
 
 from pydantic.functional_validators import BeforeValidator
 
+UUID_RE = re.compile(
+    r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z"
+)
+"""Canonical hyphenated UUID, for cheap checks of path parameters."""
+
 
 def validate_uuid_str(v: Optional[str] = None) -> Optional[str]:
     """
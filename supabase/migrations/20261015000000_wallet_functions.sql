@@ -0,0 +1,23 @@
+-- Atomic wallet mutations used by the /customers/deduct and /customers/add_money
+-- endpoints. Each call is a single UPDATE, so the balance check and the write
+-- happen in one round-trip with no window for concurrent requests in between.
+
+create or replace function deduct_wallet(cust_id uuid, amt numeric)
+returns setof "Customers"
+language sql
+as $$
+    update "Customers"
+    set wallet = wallet - amt
+    where id = cust_id and wallet >= amt
+    returning *;
+$$;
+
+create or replace function add_wallet(cust_id uuid, amt numeric)
+returns setof "Customers"
+language sql
+as $$
+    update "Customers"
+    set wallet = wallet + amt
+    where id = cust_id
+    returning *;
+$$;
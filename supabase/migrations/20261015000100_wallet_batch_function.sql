@@ -0,0 +1,14 @@
+-- Batched wallet deduction used by PUT /customers/wallet/batch. All rows are
+-- charged by one UPDATE; rows without enough money are skipped and simply do
+-- not appear in the result.
+
+create or replace function deduct_wallet_batch(deductions jsonb)
+returns table (id uuid, wallet numeric)
+language sql
+as $$
+    update "Customers" c
+    set wallet = c.wallet - v.amt
+    from jsonb_to_recordset(deductions) as v(id uuid, amt numeric)
+    where c.id = v.id and c.wallet >= v.amt
+    returning c.id, c.wallet::numeric;
+$$;
@@ -1,7 +1,7 @@
 import random
 import uuid
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from fastapi import HTTPException
@@ -103,14 +103,14 @@ class TestRegister:
         user1: Customer,
         gotrue_user: GoTrueUser,
     ) -> None:
-        user_dao = Mock()
+        user_dao = AsyncMock()
         user_dao.get_by_query.return_value = None
         user_dao.client.auth.sign_up.return_value = GoTrueAuthResponse(
             user=gotrue_user,
             session=None,
         )
 
-        response = register(register_request, user_dao)
+        response = await register(register_request, user_dao)
 
         assert user_dao.client.auth.sign_up.called
 
@@ -173,7 +173,7 @@ class TestRegister:
         marital_status: str,
         email: EmailStr,
     ) -> None:
-        user_dao = Mock()
+        user_dao = AsyncMock()
         user_dao.get_by_query.return_value = None
         user_dao.client.auth.sign_up.return_value = GoTrueAuthResponse(
             user=GoTrueUser(
@@ -195,27 +195,27 @@ class TestRegister:
         )
 
         with pytest.raises(Exception):
-            register(register_request, user_dao)
+            await register(register_request, user_dao)
 
     async def test_register_email_in_use(
         self, register_request: RegisterRequest, user1: Customer
     ) -> None:
-        user_dao = Mock()
+        user_dao = AsyncMock()
         user_dao.get_by_query.return_value = user1
 
         with pytest.raises(Exception) as exc:
-            register(register_request, user_dao)
+            await register(register_request, user_dao)
             assert "Email already in use" in str(exc.value)
 
     async def test_register_failed(
         self, register_request: RegisterRequest, user1: Customer
     ) -> None:
-        user_dao = Mock()
+        user_dao = AsyncMock()
         user_dao.get_by_query.return_value = None
         user_dao.client.auth.sign_up.side_effect = Exception()
 
         with pytest.raises(Exception) as exc:
-            register(register_request, user_dao)
+            await register(register_request, user_dao)
             assert "Registration failed, please check your credentials" in str(
                 exc.value
             )
@@ -241,23 +241,23 @@ class TestRegister:
     async def test_register_password_too_short(
         self, register_request: RegisterRequest, password: PasswordStr
     ) -> None:
-        user_dao = Mock()
+        user_dao = AsyncMock()
         user_dao.client.auth.sign_up.side_effect = Exception()
         register_request.password = password
         with pytest.raises(Exception) as exc:
-            register(register_request, user_dao)
+            await register(register_request, user_dao)
             assert exc.type == HTTPException
 
     async def test_register_email_rate_limit_exceeded(
         self, register_request: RegisterRequest
     ) -> None:
-        user_dao = Mock()
+        user_dao = AsyncMock()
         user_dao.client.auth.sign_up.side_effect = Exception(
             "Email rate limit exceeded"
         )
 
         with pytest.raises(Exception) as exc:
-            register(register_request, user_dao)
+            await register(register_request, user_dao)
             assert "Email rate limit exceeded, please try again later" in str(exc.value)
 
 
@@ -271,13 +271,13 @@ class TestLogin:
         gotrue_user: GoTrueUser,
         gotrue_session: GoTrueSession,
     ) -> None:
-        user_dao = Mock()
+        user_dao = AsyncMock()
         user_dao.get_by_query.return_value = user1
         user_dao.client.auth.sign_in_with_password.return_value = GoTrueAuthResponse(
             user=gotrue_user, session=gotrue_session
         )
 
-        response = login(login_request, user_dao)
+        response = await login(login_request, user_dao)
 
         assert user_dao.get_by_query.called
         assert user_dao.client.auth.sign_in_with_password.called
@@ -286,18 +286,18 @@ class TestLogin:
         assert response.session == session
 
     async def test_login_user_not_found(self, login_request: LoginRequest) -> None:
-        user_dao = Mock()
+        user_dao = AsyncMock()
         user_dao.get_by_query.return_value = None
 
         with pytest.raises(Exception) as exc:
-            login(login_request, user_dao)
+            await login(login_request, user_dao)
             assert "User not found" in str(exc.value)
 
     async def test_login_failed(self, login_request: LoginRequest) -> None:
-        user_dao = Mock()
+        user_dao = AsyncMock()
         user_dao.get_by_query.return_value = None
         user_dao.client.auth.sign_in_with_password.side_effect = Exception()
 
         with pytest.raises(Exception) as exc:
-            login(login_request, user_dao)
+            await login(login_request, user_dao)
             assert "Login failed, please check your credentials" in str(exc.value)
@@ -4,9 +4,16 @@ from unittest.mock import Mock, patch
 import pytest
 from fastapi import HTTPException
 from fastapi.security import HTTPAuthorizationCredentials
-from jwt import InvalidSignatureError, InvalidTokenError, encode
+from jwt import DecodeError, InvalidSignatureError, InvalidTokenError, encode
 
-from src.auth.dependencies import decode_jwt, get_access_token, get_refresh_token
+from src.auth.dependencies import (
+    _cached_decode_jwt,
+    _jwt,
+    _make_jwt_key,
+    decode_jwt,
+    get_access_token,
+    get_refresh_token,
+)
 
 
 @pytest.fixture
@@ -50,36 +57,90 @@ def valid_refresh_token() -> str:
     return "iL5m3C43Qg_1FVq3mGCNdQ"
 
 
-@patch("src.auth.dependencies.Config")
+@pytest.fixture(autouse=True)
+def clear_decode_cache() -> None:
+    _cached_decode_jwt.cache_clear()
+
+
 class TestDecodeJwt:
-    def test_decode_jwt(
-        self, mock_config: Mock, valid_jwt: str, valid_signature: str
-    ) -> None:
-        mock_config.JWT.SECRET = valid_signature
-        mock_config.JWT.ALGORITHM = "HS256"
-        mock_config.JWT.AUDIENCE = "authenticated"
-        decoded_data = decode_jwt(valid_jwt)
+    def test_decode_jwt(self, valid_jwt: str, valid_signature: str) -> None:
+        with patch(
+            "src.auth.dependencies._JWT_KEY", _make_jwt_key(valid_signature, "HS256")
+        ):
+            decoded_data = decode_jwt(valid_jwt)
         assert decoded_data["aud"] == "authenticated"
         assert int(decoded_data["exp"]) > int(time.time())
         assert int(decoded_data["iat"]) <= int(time.time())
 
-    def test_decode_jwt_invalid(
-        self, mock_config: Mock, invalid_signature: str, invalid_jwt: str
+    def test_decode_jwt_invalid(self, invalid_signature: str, invalid_jwt: str) -> None:
+        with patch(
+            "src.auth.dependencies._JWT_KEY", _make_jwt_key(invalid_signature, "HS256")
+        ):
+            with pytest.raises(InvalidTokenError):
+                decode_jwt(invalid_jwt)
+
+    def test_decode_jwt_expired(self, valid_signature: str, invalid_jwt: str) -> None:
+        with patch(
+            "src.auth.dependencies._JWT_KEY", _make_jwt_key(valid_signature, "HS256")
+        ):
+            with pytest.raises(InvalidTokenError):
+                decode_jwt(invalid_jwt)
+
+    def test_decode_jwt_no_secret(self, valid_jwt: str) -> None:
+        with patch("src.auth.dependencies._JWT_KEY", None):
+            with pytest.raises(ValueError):
+                decode_jwt(valid_jwt)
+
+    def test_decode_jwt_cached(self, valid_jwt: str, valid_signature: str) -> None:
+        with patch(
+            "src.auth.dependencies._JWT_KEY", _make_jwt_key(valid_signature, "HS256")
+        ):
+            first = decode_jwt(valid_jwt)
+            with patch.object(_jwt, "decode") as mock_decode:
+                second = decode_jwt(valid_jwt)
+        assert not mock_decode.called
+        assert first == second
+
+    def test_decode_jwt_cached_expired(
+        self, valid_jwt: str, valid_signature: str
     ) -> None:
-        mock_config.JWT.SECRET = invalid_signature
-        mock_config.JWT.ALGORITHM = "HS256"
-        mock_config.JWT.AUDIENCE = "authenticated"
-        with pytest.raises(InvalidTokenError):
-            decode_jwt(invalid_jwt)
-
-    def test_decode_jwt_expired(
-        self, mock_config: Mock, valid_signature: str, invalid_jwt: str
-    ) -> None:
-        mock_config.JWT.SECRET = valid_signature
-        mock_config.JWT.ALGORITHM = "HS256"
-        mock_config.JWT.AUDIENCE = "authenticated"
-        with pytest.raises(InvalidTokenError):
-            decode_jwt(invalid_jwt)
+        with patch(
+            "src.auth.dependencies._JWT_KEY", _make_jwt_key(valid_signature, "HS256")
+        ):
+            decode_jwt(valid_jwt)
+            with patch("src.auth.dependencies.time") as mock_time:
+                mock_time.time.return_value = time.time() + 7200
+                with pytest.raises(InvalidTokenError):
+                    decode_jwt(valid_jwt)
+
+    @pytest.mark.parametrize(
+        "token",
+        [
+            "not-a-token",
+            encode({"aud": "authenticated"}, "secret", algorithm="HS512"),
+            encode({"aud": "someone-else"}, "secret", algorithm="HS256"),
+            encode({"sub": "user"}, "secret", algorithm="HS256"),
+        ],
+    )
+    def test_decode_jwt_screened(self, valid_signature: str, token: str) -> None:
+        with patch(
+            "src.auth.dependencies._JWT_KEY", _make_jwt_key(valid_signature, "HS256")
+        ):
+            with patch.object(_jwt, "decode") as mock_decode:
+                with pytest.raises(InvalidTokenError):
+                    decode_jwt(token)
+        assert not mock_decode.called
+
+
+class TestOrjsonPyJWT:
+    def test_decode_payload(self) -> None:
+        payload = _jwt._decode_payload({"payload": b'{"aud": "authenticated"}'})
+        assert payload == {"aud": "authenticated"}
+
+    @pytest.mark.parametrize("payload", [b"not-json", b"[1, 2]"])
+    def test_decode_payload_invalid(self, payload: bytes) -> None:
+        with pytest.raises(DecodeError):
+            _jwt._decode_payload({"payload": payload})
 
 
 class TestGetAccessToken:
@@ -1,7 +1,7 @@
 import random
 import uuid
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from gotrue import AuthResponse as GoTrueAuthResponse  # type: ignore
@@ -77,20 +77,21 @@ def gotrue_user(user1: Customer) -> GoTrueUser:
     )
 
 
+@pytest.mark.asyncio
 class TestResetPassword:
-    def test_reset_password_successful(
+    async def test_reset_password_successful(
         self,
         reset_password_request: ResetPasswordRequest,
         user1: Customer,
         gotrue_user: GoTrueUser,
     ) -> None:
-        user_dao = Mock()
+        user_dao = AsyncMock()
         user_dao.client.auth.update_user.return_value = GoTrueAuthResponse(
             user=gotrue_user,
             session=None,
         )
 
-        response = reset_password(reset_password_request, user_dao)
+        response = await reset_password(reset_password_request, user_dao)
 
         assert user_dao.client.auth.update_user.called
 
@@ -114,18 +115,18 @@ class TestResetPassword:
             "Password1!",
         ],
     )
-    def test_reset_password_invalid_password(
+    async def test_reset_password_invalid_password(
         self, password: PasswordStr, reset_password_request: ResetPasswordRequest
     ) -> None:
-        user_dao = Mock()
+        user_dao = AsyncMock()
         user_dao.client.auth.update_user.side_effect = Exception()
 
         with pytest.raises(Exception):
-            reset_password(ResetPasswordRequest(password="password"), user_dao)
+            await reset_password(ResetPasswordRequest(password="password"), user_dao)
 
-    def test_reset_password_user_not_auth(self) -> None:
-        user_dao = Mock()
+    async def test_reset_password_user_not_auth(self) -> None:
+        user_dao = AsyncMock()
         user_dao.get_by_query.return_value = None
 
         with pytest.raises(Exception):
-            reset_password(ResetPasswordRequest(password="password"), user_dao)
+            await reset_password(ResetPasswordRequest(password="password"), user_dao)
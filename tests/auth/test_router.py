@@ -1,7 +1,7 @@
 import random
 import uuid
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from fastapi import status
@@ -111,7 +111,7 @@ class TestRegisterRoute:
         gotrue_user: GoTrueUser,
         user1: Customer,
     ) -> None:
-        user_dao = Mock()
+        user_dao = AsyncMock()
         user_dao.get_by_query.return_value = None
         user_dao.client.auth.sign_up.return_value = GoTrueAuthResponse(
             user=gotrue_user,
@@ -137,7 +137,7 @@ class TestLoginRoute:
         user1: Customer,
         session: Session,
     ) -> None:
-        user_dao = Mock()
+        user_dao = AsyncMock()
         user_dao.client.auth.sign_in_with_password.return_value = GoTrueAuthResponse(
             user=gotrue_user,
             session=gotrue_session,
@@ -169,7 +169,7 @@ class TestRefreshTokenRoute:
         user1: Customer,
         session: Session,
     ) -> None:
-        user_dao = Mock()
+        user_dao = AsyncMock()
         user_dao.client.auth.refresh_session.return_value = GoTrueAuthResponse(
             user=gotrue_user,
             session=gotrue_session,
@@ -205,7 +205,7 @@ class TestResetPasswordRoute:
         gotrue_user: GoTrueUser,
         user1: Customer,
     ) -> None:
-        user_dao = Mock()
+        user_dao = AsyncMock()
         user_dao.client.auth.update_user.return_value = GoTrueAuthResponse(
             user=gotrue_user,
             session=None,
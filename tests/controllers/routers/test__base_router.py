@@ -1,17 +1,19 @@
 import random
 from typing import Any, Optional, get_type_hints
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock, patch
 import uuid
 import pytest
 from fastapi import Query, status
 from pydantic import BaseModel as PydanticBaseModel, create_model
-from supabase import Client
+from supabase import AsyncClient
 from src.db.dao import BaseDAO
 from src.db.models import BaseModel
 from src.utils.data.ValidData import ValidItems
 from src.controllers.routers import BaseRouter
-from src.utils.responses import APIResponse
+from src.utils.responses import APIResponse, make_etag
 from src.utils.types import UuidStr
+
+
 # from tests.fixtures.db.dao._base_dao import TestDAO
 # from tests.fixtures.db.models._base_model import TestObject
 class TestObject(BaseModel):
@@ -37,50 +39,63 @@ def test_object1(test_objects: list[TestObject]) -> TestObject:
 def test_object2(test_objects: list[TestObject]) -> TestObject:
     return test_objects[1]
 
+
 class TestDAO(BaseDAO[TestObject]):
     __test__ = False
 
-    def __init__(self, client: Client) -> None:
+    def __init__(self, client: AsyncClient) -> None:
         super().__init__(client, "TESTS", TestObject)
 
 
 @pytest.fixture
-def test_dao_successful(test_object1: TestObject, client: Client = Mock()) -> TestDAO:
+def test_dao_successful(
+    test_object1: TestObject, client: AsyncClient = Mock()
+) -> TestDAO:
     client = Mock()
     response = APIResponse(data=[test_object1.model_dump()], message="None")
-    client.table("").select("").execute.return_value = response
-    client.table("").select("").eq("", "").execute.return_value = response
-    client.table("").select("").eq("", "").eq("", "").execute.return_value = response
-    client.table("").insert("").execute.return_value = response
-    client.table("").update("").eq("", "").execute.return_value = response
-    client.table("").delete().eq("", "").execute.return_value = response
+    client.table("").select("").execute = AsyncMock(return_value=response)
+    client.table("").select("").eq("", "").execute = AsyncMock(return_value=response)
+    client.table("").select("").eq("", "").eq("", "").execute = AsyncMock(
+        return_value=response
+    )
+    client.table("").insert("").execute = AsyncMock(return_value=response)
+    client.table("").update("").eq("", "").execute = AsyncMock(return_value=response)
+    client.table("").delete().eq("", "").execute = AsyncMock(return_value=response)
     return TestDAO(client)
 
 
 @pytest.fixture
-def test_dao_empty(client: Client = Mock()) -> TestDAO:
+def test_dao_empty(client: AsyncClient = Mock()) -> TestDAO:
     client = Mock()
     response: APIResponse[None] = APIResponse(data=[], count=None)
-    client.table("").select("").execute.return_value = response
-    client.table("").select("").eq("", "").execute.return_value = response
-    client.table("").select("").eq("", "").eq("", "").execute.return_value = response
-    client.table("").insert("").execute.return_value = response
-    client.table("").update("").eq("", "").execute.return_value = response
-    client.table("").delete().eq("", "").execute.return_value = response
+    client.table("").select("").execute = AsyncMock(return_value=response)
+    client.table("").select("").eq("", "").execute = AsyncMock(return_value=response)
+    client.table("").select("").eq("", "").eq("", "").execute = AsyncMock(
+        return_value=response
+    )
+    client.table("").insert("").execute = AsyncMock(return_value=response)
+    client.table("").update("").eq("", "").execute = AsyncMock(return_value=response)
+    client.table("").delete().eq("", "").execute = AsyncMock(return_value=response)
     return TestDAO(client)
 
 
 @pytest.fixture
-def test_dao_error(test_object1: TestObject, client: Client = Mock()) -> TestDAO:
+def test_dao_error(test_object1: TestObject, client: AsyncClient = Mock()) -> TestDAO:
     client = Mock()
-    client.table("").select("").execute.side_effect = Exception("error")
-    client.table("").select("").eq("", "").execute.side_effect = Exception("error")
-    client.table("").select("").eq("", "").eq("", "").execute.side_effect = Exception(
-        "error"
+    client.table("").select("").execute = AsyncMock(side_effect=Exception("error"))
+    client.table("").select("").eq("", "").execute = AsyncMock(
+        side_effect=Exception("error")
+    )
+    client.table("").select("").eq("", "").eq("", "").execute = AsyncMock(
+        side_effect=Exception("error")
+    )
+    client.table("").insert("").execute = AsyncMock(side_effect=Exception("error"))
+    client.table("").update("").eq("", "").execute = AsyncMock(
+        side_effect=Exception("error")
+    )
+    client.table("").delete().eq("", "").execute = AsyncMock(
+        side_effect=Exception("error")
     )
-    client.table("").insert("").execute.side_effect = Exception("error")
-    client.table("").update("").eq("", "").execute.side_effect = Exception("error")
-    client.table("").delete().eq("", "").execute.side_effect = Exception("error")
     return TestDAO(client)
 
 
@@ -116,10 +131,12 @@ def router_error(test_dao_error: TestDAO) -> BaseRouter[TestObject]:
         get_dao=lambda: test_dao_error,
     )
 
+
 @pytest.fixture
 def uuid_generator() -> Mock:
     return Mock(side_effect=lambda: str(uuid.UUID(int=random.getrandbits(128))))
 
+
 @pytest.fixture
 def test_query() -> PydanticBaseModel:
     fields = dict(get_type_hints(TestObject))
@@ -177,6 +194,79 @@ class TestCreate:
 
 @pytest.mark.asyncio
 class TestGetById:
+    @pytest.fixture
+    def object_id(self, test_object1: TestObject) -> str:
+        assert test_object1.id is not None
+        return test_object1.id
+
+    async def test_get_by_id_etag(
+        self,
+        router_successful: BaseRouter[TestObject],
+        test_object1: TestObject,
+        object_id: str,
+    ) -> None:
+        dao = Mock()
+        dao.get_by_id = AsyncMock(return_value=test_object1)
+        response = await router_successful.get_by_id(id=object_id, dao=dao)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] == make_etag(
+            test_object1.model_dump_json().encode()
+        )
+
+    async def test_get_by_id_not_modified(
+        self,
+        router_successful: BaseRouter[TestObject],
+        test_object1: TestObject,
+        object_id: str,
+    ) -> None:
+        dao = Mock()
+        dao.get_by_id = AsyncMock(return_value=test_object1)
+        etag = (await router_successful.get_by_id(id=object_id, dao=dao)).headers[
+            "ETag"
+        ]
+        response = await router_successful.get_by_id(
+            id=object_id, dao=dao, if_none_match=f'"other", W/{etag}'
+        )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+        assert response.body == b""
+
+    async def test_get_by_id_not_modified_skips_body(
+        self,
+        router_successful: BaseRouter[TestObject],
+        test_object1: TestObject,
+        object_id: str,
+    ) -> None:
+        dao = Mock()
+        dao.get_by_id = AsyncMock(return_value=test_object1)
+        etag = make_etag(test_object1.model_dump_json().encode())
+        with patch("src.controllers.routers._base_router.APIResponse") as response:
+            await router_successful.get_by_id(id=object_id, dao=dao, if_none_match=etag)
+
+        assert not response.called
+
+    async def test_get_by_id_etag_changes(
+        self,
+        router_successful: BaseRouter[TestObject],
+        test_object1: TestObject,
+        test_object2: TestObject,
+        object_id: str,
+    ) -> None:
+        dao = Mock()
+        dao.get_by_id = AsyncMock(return_value=test_object1)
+        etag = (await router_successful.get_by_id(id=object_id, dao=dao)).headers[
+            "ETag"
+        ]
+        dao.get_by_id = AsyncMock(return_value=test_object2)
+        response = await router_successful.get_by_id(
+            id=object_id, dao=dao, if_none_match=etag
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
+
     async def test_get_by_id_error(
         self, router_error: BaseRouter[TestObject], test_dao_error: TestDAO
     ) -> None:
@@ -0,0 +1,216 @@
+import random
+import uuid
+from typing import Iterator
+from unittest.mock import Mock
+
+import pytest
+from fastapi import HTTPException, status
+from fastapi.testclient import TestClient
+
+from src.controllers.routers.customer import (
+    add_money_to_wallet,
+    deduct_money,
+    deduct_money_batch,
+)
+from src.controllers.schemas.wallet_request_schema import (
+    MAX_BATCH_DEDUCTIONS,
+    WalletDeduction,
+)
+from src.db.dao import CustomerDAO
+from src.db.dependencies import get_customer_dao
+from src.db.models import Customer
+from src.main import app
+
+
+@pytest.fixture
+def uuid_generator() -> Mock:
+    return Mock(side_effect=lambda: str(uuid.UUID(int=random.getrandbits(128))))
+
+
+@pytest.fixture
+def customer_id(uuid_generator: Mock) -> str:
+    return str(uuid_generator())
+
+
+@pytest.fixture
+def customer1(customer_id: str) -> Customer:
+    return Customer(
+        id=customer_id,
+        fullname="Rayan Alves",
+        username="rayan",
+        age=19,
+        gender="Male",
+        address="Riyadh",
+        marital_status="Single",
+        email="rayan@mail.com",
+        wallet=50.0,
+    )
+
+
+@pytest.fixture
+def customer_dao() -> Mock:
+    return Mock(spec=CustomerDAO)
+
+
+@pytest.mark.asyncio
+class TestDeductMoney:
+    async def test_deduct_money_successful(
+        self, customer_dao: Mock, customer1: Customer, customer_id: str
+    ) -> None:
+        customer_dao.deduct_wallet.return_value = customer1.model_copy(
+            update={"wallet": 30.0}
+        )
+        response = await deduct_money(customer_id, 20.0, customer_dao)
+        res = eval(bytes(response.body).decode("utf-8"))
+
+        customer_dao.deduct_wallet.assert_called_once_with(customer_id, 20.0)
+        assert not customer_dao.get_wallet.called
+        assert response.status_code == status.HTTP_200_OK
+        assert res["data"] == {"wallet": 30.0}
+
+    async def test_deduct_money_not_enough(
+        self, customer_dao: Mock, customer1: Customer, customer_id: str
+    ) -> None:
+        customer_dao.deduct_wallet.return_value = None
+        customer_dao.get_wallet.return_value = customer1.wallet
+        response = await deduct_money(customer_id, 100.0, customer_dao)
+        res = eval(bytes(response.body).decode("utf-8"))
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert res["data"] == {"wallet": 50.0}
+
+    async def test_deduct_money_not_found(
+        self, customer_dao: Mock, customer_id: str
+    ) -> None:
+        customer_dao.deduct_wallet.return_value = None
+        customer_dao.get_wallet.return_value = None
+        response = await deduct_money(customer_id, 20.0, customer_dao)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_deduct_money_invalid_id(self, customer_dao: Mock) -> None:
+        with pytest.raises(HTTPException) as exc:
+            await deduct_money("not-a-uuid", 20.0, customer_dao)
+
+        assert exc.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert not customer_dao.deduct_wallet.called
+
+
+@pytest.mark.asyncio
+class TestAddMoneyToWallet:
+    async def test_add_money_successful(
+        self, customer_dao: Mock, customer1: Customer, customer_id: str
+    ) -> None:
+        customer_dao.add_to_wallet.return_value = customer1.model_copy(
+            update={"wallet": 70.0}
+        )
+        response = await add_money_to_wallet(customer_id, 20.0, customer_dao)
+        res = eval(bytes(response.body).decode("utf-8"))
+
+        customer_dao.add_to_wallet.assert_called_once_with(customer_id, 20.0)
+        assert response.status_code == status.HTTP_200_OK
+        assert res["data"] == {"wallet": 70.0}
+
+    async def test_add_money_not_found(
+        self, customer_dao: Mock, customer_id: str
+    ) -> None:
+        customer_dao.add_to_wallet.return_value = None
+        response = await add_money_to_wallet(customer_id, 20.0, customer_dao)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_add_money_invalid_id(self, customer_dao: Mock) -> None:
+        with pytest.raises(HTTPException) as exc:
+            await add_money_to_wallet("not-a-uuid", 20.0, customer_dao)
+
+        assert exc.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert not customer_dao.add_to_wallet.called
+
+
+@pytest.mark.asyncio
+class TestDeductMoneyBatch:
+    async def test_deduct_money_batch_successful(
+        self, customer_dao: Mock, uuid_generator: Mock
+    ) -> None:
+        id1, id2 = uuid_generator(), uuid_generator()
+        customer_dao.deduct_wallet_many.return_value = {id1: 10.0, id2: 5.0}
+        request = [
+            WalletDeduction(id=id1, amount=10.0),
+            WalletDeduction(id=id2, amount=2.5),
+            WalletDeduction(id=id2, amount=2.5),
+        ]
+        response = await deduct_money_batch(request, customer_dao)
+        res = eval(bytes(response.body).decode("utf-8"))
+
+        customer_dao.deduct_wallet_many.assert_called_once_with({id1: 10.0, id2: 5.0})
+        assert response.status_code == status.HTTP_200_OK
+        assert res["data"] == {"wallets": {id1: 10.0, id2: 5.0}, "failed": []}
+
+    async def test_deduct_money_batch_partial(
+        self, customer_dao: Mock, uuid_generator: Mock
+    ) -> None:
+        id1, id2 = uuid_generator(), uuid_generator()
+        customer_dao.deduct_wallet_many.return_value = {id1: 10.0}
+        request = [
+            WalletDeduction(id=id1, amount=10.0),
+            WalletDeduction(id=id2, amount=500.0),
+        ]
+        response = await deduct_money_batch(request, customer_dao)
+        res = eval(bytes(response.body).decode("utf-8"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert res["data"] == {"wallets": {id1: 10.0}, "failed": [id2]}
+
+    async def test_deduct_money_batch_all_failed(
+        self, customer_dao: Mock, uuid_generator: Mock
+    ) -> None:
+        id1 = uuid_generator()
+        customer_dao.deduct_wallet_many.return_value = {}
+        request = [WalletDeduction(id=id1, amount=500.0)]
+        response = await deduct_money_batch(request, customer_dao)
+        res = eval(bytes(response.body).decode("utf-8"))
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert res["data"] == {"wallets": {}, "failed": [id1]}
+
+    async def test_deduct_money_batch_canonicalizes_ids(
+        self, customer_dao: Mock, uuid_generator: Mock
+    ) -> None:
+        id1 = uuid_generator()
+        customer_dao.deduct_wallet_many.return_value = {id1: 5.0}
+        request = [
+            WalletDeduction(id=id1.upper(), amount=2.5),
+            WalletDeduction(id="{" + id1.replace("-", "") + "}", amount=2.5),
+        ]
+        response = await deduct_money_batch(request, customer_dao)
+        res = eval(bytes(response.body).decode("utf-8"))
+
+        customer_dao.deduct_wallet_many.assert_called_once_with({id1: 5.0})
+        assert response.status_code == status.HTTP_200_OK
+        assert res["data"] == {"wallets": {id1: 5.0}, "failed": []}
+
+
+class TestDeductMoneyBatchValidation:
+    @pytest.fixture
+    def client(self, customer_dao: Mock) -> Iterator[TestClient]:
+        app.dependency_overrides[get_customer_dao] = lambda: customer_dao
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_empty_batch(self, client: TestClient, customer_dao: Mock) -> None:
+        response = client.put("/customers/wallet/batch", json=[])
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert not customer_dao.deduct_wallet_many.called
+
+    def test_batch_too_large(
+        self, client: TestClient, customer_dao: Mock, uuid_generator: Mock
+    ) -> None:
+        request = [
+            {"id": uuid_generator(), "amount": 1.0}
+            for _ in range(MAX_BATCH_DEDUCTIONS + 1)
+        ]
+        response = client.put("/customers/wallet/batch", json=request)
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert not customer_dao.deduct_wallet_many.called
@@ -0,0 +1,113 @@
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.db.dao import CustomerDAO
+from src.db.models import Customer
+
+
+@pytest.fixture
+def client() -> Mock:
+    return Mock()
+
+
+@pytest.mark.asyncio
+class TestGetWallet:
+    async def test_get_wallet(self, client: Mock) -> None:
+        query = client.table("").select("").eq("", "").limit(1)
+        query.execute = AsyncMock(return_value=Mock(data=[{"wallet": 42.5}]))
+
+        wallet = await CustomerDAO(client).get_wallet("id")
+
+        client.table("").select.assert_called_with("wallet")
+        assert wallet == 42.5
+
+    async def test_get_wallet_not_found(self, client: Mock) -> None:
+        query = client.table("").select("").eq("", "").limit(1)
+        query.execute = AsyncMock(return_value=Mock(data=[]))
+
+        assert await CustomerDAO(client).get_wallet("id") is None
+
+
+@pytest.fixture
+def customer_row() -> dict[str, Any]:
+    return {
+        "id": "a3b417cc-8b3f-495a-9c1d-2f6e5b7d8e90",
+        "fullname": "Rayan Alves",
+        "email": "rayan@mail.com",
+        "username": "rayan",
+        "age": 19,
+        "gender": "Male",
+        "address": "Riyadh",
+        "marital_status": "Single",
+        "wallet": 30.0,
+    }
+
+
+@pytest.mark.asyncio
+class TestDeductWallet:
+    async def test_deduct_wallet(
+        self, client: Mock, customer_row: dict[str, Any]
+    ) -> None:
+        client.rpc("", {}).execute = AsyncMock(return_value=Mock(data=[customer_row]))
+
+        customer = await CustomerDAO(client).deduct_wallet(customer_row["id"], 20.0)
+
+        client.rpc.assert_called_with(
+            "deduct_wallet", {"cust_id": customer_row["id"], "amt": 20.0}
+        )
+        assert customer == Customer.model_validate(customer_row)
+
+    async def test_deduct_wallet_rejected(self, client: Mock) -> None:
+        client.rpc("", {}).execute = AsyncMock(return_value=Mock(data=[]))
+
+        assert await CustomerDAO(client).deduct_wallet("id", 20.0) is None
+
+
+@pytest.mark.asyncio
+class TestDeductWalletMany:
+    async def test_deduct_wallet_many(self, client: Mock) -> None:
+        client.rpc("", {}).execute = AsyncMock(
+            return_value=Mock(data=[{"id": "id1", "wallet": "7.5"}])
+        )
+
+        wallets = await CustomerDAO(client).deduct_wallet_many(
+            {"id1": 2.5, "id2": 500.0}
+        )
+
+        client.rpc.assert_called_with(
+            "deduct_wallet_batch",
+            {
+                "deductions": [
+                    {"id": "id1", "amt": 2.5},
+                    {"id": "id2", "amt": 500.0},
+                ]
+            },
+        )
+        assert wallets == {"id1": 7.5}
+
+    async def test_deduct_wallet_many_none_applied(self, client: Mock) -> None:
+        client.rpc("", {}).execute = AsyncMock(return_value=Mock(data=[]))
+
+        assert await CustomerDAO(client).deduct_wallet_many({"id1": 500.0}) == {}
+
+
+@pytest.mark.asyncio
+class TestAddToWallet:
+    async def test_add_to_wallet(
+        self, client: Mock, customer_row: dict[str, Any]
+    ) -> None:
+        client.rpc("", {}).execute = AsyncMock(return_value=Mock(data=[customer_row]))
+
+        customer = await CustomerDAO(client).add_to_wallet(customer_row["id"], 20.0)
+
+        client.rpc.assert_called_with(
+            "add_wallet", {"cust_id": customer_row["id"], "amt": 20.0}
+        )
+        assert customer == Customer.model_validate(customer_row)
+
+    async def test_add_to_wallet_not_found(self, client: Mock) -> None:
+        client.rpc("", {}).execute = AsyncMock(return_value=Mock(data=[]))
+
+        assert await CustomerDAO(client).add_to_wallet("id", 20.0) is None
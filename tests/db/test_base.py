@@ -0,0 +1,106 @@
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.db import base
+from src.db.base import (
+    _authenticated_clients,
+    get_authenticated_client,
+    get_uncached_authenticated_client,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache() -> None:
+    _authenticated_clients.clear()
+
+
+@pytest.mark.asyncio
+@patch("src.db.base.acreate_client", new_callable=AsyncMock)
+@patch("src.db.base.Config")
+class TestGetAuthenticatedClient:
+    async def test_reuses_client_for_same_tokens(
+        self, mock_config: Mock, mock_create_client: AsyncMock
+    ) -> None:
+        mock_config.SUPABASE.URL = "https://example.supabase.co"
+        mock_config.SUPABASE.KEY = "key"
+        mock_create_client.return_value = AsyncMock()
+        first = await get_authenticated_client("access", "refresh")
+        second = await get_authenticated_client("access", "refresh")
+
+        assert first is second
+        assert mock_create_client.await_count == 1
+        first.auth.set_session.assert_awaited_once_with(
+            access_token="access", refresh_token="refresh"
+        )
+
+    async def test_new_client_for_other_tokens(
+        self, mock_config: Mock, mock_create_client: AsyncMock
+    ) -> None:
+        mock_config.SUPABASE.URL = "https://example.supabase.co"
+        mock_config.SUPABASE.KEY = "key"
+        mock_create_client.side_effect = lambda **_: AsyncMock()
+        first = await get_authenticated_client("access", "refresh")
+        second = await get_authenticated_client("other-access", "other-refresh")
+
+        assert first is not second
+        assert mock_create_client.await_count == 2
+
+    async def test_auto_refresh_disabled(
+        self, mock_config: Mock, mock_create_client: AsyncMock
+    ) -> None:
+        mock_config.SUPABASE.URL = "https://example.supabase.co"
+        mock_config.SUPABASE.KEY = "key"
+        mock_create_client.return_value = AsyncMock()
+        await get_authenticated_client("access", "refresh")
+
+        options = mock_create_client.call_args.kwargs["options"]
+        assert options.auto_refresh_token is False
+
+    async def test_evicted_client_closed(
+        self, mock_config: Mock, mock_create_client: AsyncMock
+    ) -> None:
+        mock_config.SUPABASE.URL = "https://example.supabase.co"
+        mock_config.SUPABASE.KEY = "key"
+        first, second = AsyncMock(), AsyncMock()
+        mock_create_client.side_effect = [first, second]
+        with patch.object(base, "_AUTHENTICATED_CLIENTS_MAXSIZE", 1):
+            await get_authenticated_client("access", "refresh")
+            await get_authenticated_client("other-access", "other-refresh")
+
+        first.auth.close.assert_awaited_once()
+        first._postgrest.aclose.assert_awaited_once()
+        assert not second.auth.close.called
+        assert list(_authenticated_clients.values()) == [second]
+
+    async def test_missing_config(
+        self, mock_config: Mock, mock_create_client: AsyncMock
+    ) -> None:
+        mock_config.SUPABASE.URL = None
+        mock_config.SUPABASE.KEY = None
+        with pytest.raises(ValueError):
+            await get_authenticated_client("access", "refresh")
+
+
+@pytest.mark.asyncio
+@patch("src.db.base.acreate_client", new_callable=AsyncMock)
+@patch("src.db.base.Config")
+class TestGetUncachedAuthenticatedClient:
+    async def test_fresh_client_closed_after_use(
+        self, mock_config: Mock, mock_create_client: AsyncMock
+    ) -> None:
+        mock_config.SUPABASE.URL = "https://example.supabase.co"
+        mock_config.SUPABASE.KEY = "key"
+        mock_create_client.side_effect = lambda **_: AsyncMock()
+        cached = await get_authenticated_client("access", "refresh")
+        clients = get_uncached_authenticated_client("access", "refresh")
+        client = await anext(clients)
+
+        assert client is not cached
+        client.auth.set_session.assert_awaited_once_with(
+            access_token="access", refresh_token="refresh"
+        )
+        with pytest.raises(StopAsyncIteration):
+            await anext(clients)
+        client.auth.close.assert_awaited_once()
+        assert list(_authenticated_clients.values()) == [cached]
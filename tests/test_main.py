@@ -1,4 +1,15 @@
+import uuid
+from typing import Iterator
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+from fastapi.responses import ORJSONResponse
+from fastapi.testclient import TestClient
+from postgrest.exceptions import APIError as PostgrestAPIError
+
 from src.config import Config
+from src.db.dependencies import get_customer_dao
 from src.main import app
 
 
@@ -7,3 +18,107 @@ class TestMain:
         assert app.title == Config.APP.TITLE
         assert app.description == Config.APP.DESCRIPTION
         assert app.version == Config.APP.VERSION
+
+    def test_main_default_response_class(self) -> None:
+        assert app.router.default_response_class is ORJSONResponse
+
+
+class TestRoot:
+    def test_root(self) -> None:
+        response = TestClient(app).get("/")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+        assert "Welcome to the Ecommerce" in response.text
+        assert response.headers["etag"]
+
+    def test_root_not_modified(self) -> None:
+        client = TestClient(app)
+        etag = client.get("/").headers["etag"]
+        response = client.get("/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_root_not_modified_etag_list(self) -> None:
+        client = TestClient(app)
+        etag = client.get("/").headers["etag"]
+        response = client.get("/", headers={"If-None-Match": f'"other", {etag}'})
+        assert response.status_code == 304
+
+    def test_root_not_modified_wildcard(self) -> None:
+        response = TestClient(app).get("/", headers={"If-None-Match": "*"})
+        assert response.status_code == 304
+
+
+class TestCors:
+    def test_preflight_cached(self) -> None:
+        response = TestClient(app).options(
+            "/customers/",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "GET",
+                "Access-Control-Request-Headers": "authorization, refresh-token",
+            },
+        )
+        assert response.status_code == 200
+        assert response.headers["access-control-max-age"] == "86400"
+
+
+class TestExceptionHandlers:
+    @pytest.fixture
+    def failing_dao(self) -> Iterator[Mock]:
+        dao = Mock()
+        app.dependency_overrides[get_customer_dao] = lambda: dao
+        yield dao
+        app.dependency_overrides.clear()
+
+    def test_postgrest_error(
+        self, failing_dao: Mock, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        failing_dao.deduct_wallet = AsyncMock(
+            side_effect=PostgrestAPIError(
+                {
+                    "message": 'new row violates row-level security policy for "Customers"'
+                }
+            )
+        )
+        response = TestClient(app).put(
+            f"/customers/deduct/{uuid.uuid4()}", params={"amount": 10}
+        )
+        assert response.status_code == 500
+        assert response.json() == {"message": "Database request failed", "data": {}}
+        assert "row-level security" in caplog.text
+
+    def test_unhandled_error(self, failing_dao: Mock) -> None:
+        failing_dao.deduct_wallet = AsyncMock(side_effect=RuntimeError("secret"))
+        response = TestClient(app, raise_server_exceptions=False).put(
+            f"/customers/deduct/{uuid.uuid4()}", params={"amount": 10}
+        )
+        assert response.status_code == 500
+        assert response.json() == {"message": "Internal Server Error", "data": {}}
+
+    def test_connection_error_keeps_cors(self, failing_dao: Mock) -> None:
+        failing_dao.deduct_wallet = AsyncMock(
+            side_effect=httpx.ConnectError("db.internal refused")
+        )
+        response = TestClient(app).put(
+            f"/customers/deduct/{uuid.uuid4()}",
+            params={"amount": 10},
+            headers={"Origin": "http://localhost:3000"},
+        )
+        assert response.status_code == 500
+        assert response.json() == {"message": "Database request failed", "data": {}}
+        assert (
+            response.headers["access-control-allow-origin"] == "http://localhost:3000"
+        )
+
+    def test_postgrest_error_keeps_cors(self, failing_dao: Mock) -> None:
+        failing_dao.deduct_wallet = AsyncMock(
+            side_effect=PostgrestAPIError({"message": "boom"})
+        )
+        response = TestClient(app).put(
+            f"/customers/deduct/{uuid.uuid4()}",
+            params={"amount": 10},
+            headers={"Origin": "http://localhost:3000"},
+        )
+        assert response.status_code == 500
+        assert "access-control-allow-origin" in response.headers